@@ -2,10 +2,10 @@
 # High-level modules should not depend on low-level modules. Both should depend on abstractions.
 # Abstractions should not depend on details. Details should depend on abstractions.
 
-from abc import ABC, abstractmethod
-from enum import Enum
+import sys
+from enum import IntEnum
 
-class Relationship(Enum):
+class Relationship(IntEnum):
     """An enumeration that defines the types of relationships between people."""
     PARENT = 0
     CHILD = 1
@@ -14,18 +14,34 @@ class Relationship(Enum):
 class Person:
     """Represents a person with a name."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         """Initializes a new person with the specified name.
         
         Args:
             name (str): The name of the person.
         """
-        self.name = name 
+        self.name: str = sys.intern(name) if type(name) is str else name
+
+class RelationshipBrowser:
+    """An abstract base class (interface) that defines the operations for browsing relationships.
+
+    A plain class is used instead of `abc.ABC` so that `isinstance` checks take the fast
+    built-in path; `__abstractmethods__` is set below and recomputed for every subclass, so
+    neither the interface nor an incomplete implementation can be instantiated.
+    """
 
-class RelationshipBrowser(ABC):
-    """An abstract base class (interface) that defines the operations for browsing relationships."""
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Keeps a subclass abstract until it overrides every abstract method."""
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = frozenset(
+            name for name in RelationshipBrowser.__abstractmethods__
+            if getattr(cls, name) is getattr(RelationshipBrowser, name)
+        )
     
-    @abstractmethod
     def find_all_children_of(self, name):
         """Finds and returns all children of a person with the given name.
         
@@ -33,41 +49,42 @@ class RelationshipBrowser(ABC):
             name (str): The name of the person whose children are to be found.
         
         Returns:
-            generator: A generator yielding the names of all children.
+            iterable: The names of all children.
         """
-        pass
+        raise NotImplementedError
+
+RelationshipBrowser.__abstractmethods__ = frozenset({"find_all_children_of"})
 
 class Relationships(RelationshipBrowser): 
     """A low-level module that stores and manages relationships between people.
     This class implements the `RelationshipBrowser` interface.
     """
 
+    __slots__ = ("_children_by_parent",)
+
     def __init__(self):
-        """Initializes an empty list of relationships."""
-        self.relations = []
+        """Initializes an empty index of children by parent name."""
+        self._children_by_parent: dict[str, list[str]] = {}
         
-    def add_parent_and_child(self, parent, child):
-        """Adds a parent-child relationship to the list.
+    def add_parent_and_child(self, parent: Person, child: Person):
+        """Adds a parent-child relationship to the index.
         
         Args:
             parent (Person): The parent in the relationship.
             child (Person): The child in the relationship.
         """
-        self.relations.append((parent, Relationship.PARENT, child))
-        self.relations.append((child, Relationship.CHILD, parent))
+        self._children_by_parent.setdefault(parent.name, []).append(child.name)
     
-    def find_all_children_of(self, name):
+    def find_all_children_of(self, name) -> tuple[str, ...]:
         """Finds and returns all children of a person with the given name.
         
         Args:
             name (str): The name of the person whose children are to be found.
         
         Returns:
-            generator: A generator yielding the names of all children.
+            tuple: The names of all children, copied so callers cannot modify the index.
         """
-        for r in self.relations:
-            if r[0].name == name and r[1] == Relationship.PARENT:
-                yield r[2].name
+        return tuple(self._children_by_parent.get(name, ()))
 
 class Research: 
     """A high-level module that depends on the abstraction `RelationshipBrowser` 
@@ -82,10 +99,8 @@ class Research:
     #     Args:
     #         relationships (Relationships): A concrete instance of the `Relationships` class.
     #     """
-    #     relations = relationships.relations
-    #     for r in relations:
-    #         if r[0].name == 'John' and r[1] == Relationship.PARENT:
-    #             print(f'John has a child called {r[2].name}.')
+    #     for child in relationships._children_by_parent.get('John', ()):
+    #         print(f'John has a child called {child}.')
     
     def __init__(self, browser: RelationshipBrowser, person: Person):
         """Initializes the Research object and prints the children of the given person.
@@ -97,17 +112,19 @@ class Research:
             browser (RelationshipBrowser): An object that implements the `RelationshipBrowser` interface.
             person (Person): The person whose children are to be researched.
         """
-        for child in browser.find_all_children_of(person.name):
-            print(f'{person.name} has a child called {child}')
+        lines: list[str] = [f'{person.name} has a child called {child}' for child in browser.find_all_children_of(person.name)]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
 # Usage Example:
 
-parent = Person('John')
-child1 = Person('Chris')
-child2 = Person('Matt')
+if __name__ == "__main__":
+    parent = Person('John')
+    child1 = Person('Chris')
+    child2 = Person('Matt')
 
-relationships = Relationships()
-relationships.add_parent_and_child(parent, child1)
-relationships.add_parent_and_child(parent, child2)
+    relationships = Relationships()
+    relationships.add_parent_and_child(parent, child1)
+    relationships.add_parent_and_child(parent, child2)
 
-Research(relationships, parent)
+    Research(relationships, parent)
@@ -2,14 +2,30 @@
 # Clients should not be forced to depend on interfaces they do not use. 
 # It's better to have many client-specific interfaces than to have one general-purpose interface.
 
-from abc import ABC, abstractmethod
+def _inherited_abstract_methods(cls):
+    """Returns the names of the abstract methods that `cls` inherits without overriding them.
 
-class Machine(ABC):
+    The interfaces below are plain classes rather than `abc.ABC` subclasses so that `isinstance`
+    checks take the fast built-in path; each one sets `__abstractmethods__` itself and uses this
+    helper in `__init_subclass__` so that incomplete implementations still cannot be instantiated.
+    """
+    return frozenset(
+        name
+        for base in cls.__mro__[1:]
+        for name in base.__dict__.get("__abstractmethods__", ())
+        if getattr(cls, name) is getattr(base, name)
+    )
+
+class Machine:
     """An interface that defines a general-purpose machine with print, fax, and scan capabilities.
     This interface violates the Interface Segregation Principle by forcing clients to implement methods they may not need.
     """
+
+    def __init_subclass__(cls, **kwargs):
+        """Keeps a subclass abstract until it overrides every abstract method."""
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = _inherited_abstract_methods(cls)
     
-    @abstractmethod
     def print(self, doc):
         """Prints a document.
         
@@ -18,7 +34,6 @@ class Machine(ABC):
         """
         raise NotImplementedError
     
-    @abstractmethod
     def fax(self, doc):
         """Faxes a document.
         
@@ -27,7 +42,6 @@ class Machine(ABC):
         """
         raise NotImplementedError
     
-    @abstractmethod
     def scan(self, doc):
         """Scans a document.
         
@@ -36,6 +50,8 @@ class Machine(ABC):
         """
         raise NotImplementedError
   
+Machine.__abstractmethods__ = frozenset({"print", "fax", "scan"})
+
 class MultiFunctionPrinter(Machine):
     """A concrete implementation of a modern printer that can print, fax, and scan documents.
     This class implements all methods of the Machine interface.
@@ -72,34 +88,46 @@ class OldFashionPrinter(Machine):
 
 # Applying the Interface Segregation Principle:
 
-class Printer(ABC):
+class Printer:
     """A specific interface for printers."""
 
-    @abstractmethod
+    def __init_subclass__(cls, **kwargs):
+        """Keeps a subclass abstract until it overrides every abstract method."""
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = _inherited_abstract_methods(cls)
+
     def print(self, doc):
         """Prints a document."""
-        pass 
+        raise NotImplementedError
 
-class Scanner(ABC):
+Printer.__abstractmethods__ = frozenset({"print"})
+
+class Scanner:
     """A specific interface for scanners."""
 
-    @abstractmethod
+    def __init_subclass__(cls, **kwargs):
+        """Keeps a subclass abstract until it overrides every abstract method."""
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = _inherited_abstract_methods(cls)
+
     def scan(self, doc):
         """Scans a document."""
-        pass 
+        raise NotImplementedError
+
+Scanner.__abstractmethods__ = frozenset({"scan"})
 
 class MultiFunctionDevice(Printer, Scanner):
     """An interface for a device that can both print and scan."""
 
-    @abstractmethod
     def print(self, doc):
         """Prints a document."""
-        pass 
+        raise NotImplementedError
     
-    @abstractmethod
     def scan(self, doc):
         """Scans a document."""
-        pass
+        raise NotImplementedError
+
+MultiFunctionDevice.__abstractmethods__ = frozenset({"print", "scan"})
 
 # Concrete implementations:
 
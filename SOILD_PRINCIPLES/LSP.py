@@ -6,7 +6,13 @@
 # Example:
 
 class Rectangle:
-    """Represents a rectangle shape with width and height."""
+    """Represents a rectangle shape with width and height.
+
+    The area is kept up to date by the width and height setters, so reading `area`
+    returns a stored value rather than recomputing it.
+    """
+
+    __slots__ = ("_width", "_height", "_area")
 
     def __init__(self, width, height):
         """Initializes a new rectangle with the specified width and height.
@@ -17,15 +23,16 @@ class Rectangle:
         """
         self._width = width
         self._height = height
+        self._area = width * height
     
     @property
     def area(self):
-        """Calculates and returns the area of the rectangle.
+        """Returns the area of the rectangle.
         
         Returns:
             int: The area of the rectangle.
         """
-        return self.width * self.height
+        return self._area
 
     def __str__(self):
         """Returns the string representation of the rectangle."""
@@ -40,6 +47,7 @@ class Rectangle:
     def width(self, value):
         """Sets the width of the rectangle."""
         self._width = value
+        self._area = self._width * self._height
         
     @property
     def height(self):
@@ -50,10 +58,13 @@ class Rectangle:
     def height(self, value):
         """Sets the height of the rectangle."""
         self._height = value
+        self._area = self._width * self._height
 
 class Square(Rectangle):
     """Represents a square, which is a special case of a rectangle where width equals height."""
 
+    __slots__ = ()
+
     def __init__(self, size):
         """Initializes a new square with the specified size for both width and height.
         
@@ -66,11 +77,13 @@ class Square(Rectangle):
     def width(self, value):
         """Sets both the width and height of the square to the same value."""
         self._width = self._height = value
+        self._area = value * value
         
     @Rectangle.height.setter
     def height(self, value):
         """Sets both the height and width of the square to the same value."""
         self._height = self._width = value
+        self._area = value * value
 
 def use_it(rc):
     """A function that works with any rectangle-like object and expects to manipulate its height.
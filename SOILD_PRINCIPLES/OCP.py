@@ -3,16 +3,26 @@
 
 # Example:
 
-from enum import Enum
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import IntEnum
 
-class Color(Enum):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only `ProductTable` and `BetterFilter.filter_table` need it.
+    np = None
+
+try:
+    import ocp_fast
+except ImportError:  # The compiled specifications are optional; build them with setup.py.
+    ocp_fast = None
+
+class Color(IntEnum):
     """Enumeration for colors."""
     RED = 1
     GREEN = 2
     BLUE = 3
 
-class Size(Enum):
+class Size(IntEnum):
     """Enumeration for sizes."""
     SMALL = 1
     MEDIUM = 2
@@ -20,6 +30,8 @@ class Size(Enum):
 
 class Product:
     """Represents a product with a name, color, and size."""
+
+    __slots__ = ("name", "color", "size")
     
     def __init__(self, name, color, size):
         """Initializes a new product.
@@ -33,58 +45,43 @@ class Product:
         self.color = color 
         self.size = size
 
-# The old Filter that violates OCP:
-class productFilter:
-    """Filters products by their attributes. This class violates the Open-Closed Principle."""
+@dataclass
+class ProductTable:
+    """Column-oriented view of a list of products, used for vectorized filtering.
 
-    def filter_by_color(self, products, color):
-        """Filters products by color.
-        
-        Args:
-            products (list): List of products to filter.
-            color (Color): Color to filter by.
-            
-        Yields:
-            Product: A product that matches the color.
-        """
-        for p in products:
-            if p.color == color:
-                yield p  
-    
-    def filter_by_size(self, products, size):
-        """Filters products by size.
-        
-        Args:
-            products (list): List of products to filter.
-            size (Size): Size to filter by.
-            
-        Yields:
-            Product: A product that matches the size.
-        """
-        for p in products:
-            if p.size == size:
-                yield p
+    Attributes:
+        names (list): The names of the products.
+        colors (np.ndarray): The `Color` values of the products as an `int8` array.
+        sizes (np.ndarray): The `Size` values of the products as an `int8` array.
+    """
+    names: list
+    colors: "np.ndarray"
+    sizes: "np.ndarray"
 
-    def filter_by_size_and_color(self, products, size, color):
-        """Filters products by both size and color.
+    @classmethod
+    def from_products(cls, products):
+        """Builds a product table from a list of products.
         
         Args:
-            products (list): List of products to filter.
-            size (Size): Size to filter by.
-            color (Color): Color to filter by.
+            products (list): List of products to convert.
             
-        Yields:
-            Product: A product that matches the size and color.
+        Returns:
+            ProductTable: A table holding one column per product attribute.
         """
-        for p in products:
-            if (p.size == size) and (p.color == color):
-                yield p
+        if np is None:
+            raise ImportError("ProductTable requires NumPy")
+        return cls(
+            names=[p.name for p in products],
+            colors=np.fromiter((p.color.value for p in products), dtype=np.int8, count=len(products)),
+            sizes=np.fromiter((p.size.value for p in products), dtype=np.int8, count=len(products)),
+        )
 
 # Enterprise Patterns: Specification Pattern
-class Specification(ABC):
+class Specification:
     """Base class for a specification to check if a product meets a certain criterion."""
 
-    @abstractmethod
+    __slots__ = ()
+
     def is_satisfied(self, item):
         """Determines if an item satisfies the specification.
         
@@ -94,12 +91,34 @@ class Specification(ABC):
         Returns:
             bool: True if the item satisfies the specification, False otherwise.
         """
-        pass
+        raise NotImplementedError
+
+    def mask(self, colors, sizes):
+        """Evaluates the specification over whole columns of products at once.
+        
+        Args:
+            colors (np.ndarray): The color values of the products.
+            sizes (np.ndarray): The size values of the products.
+            
+        Returns:
+            np.ndarray: A boolean array that is True where the product satisfies the specification.
+        """
+        raise NotImplementedError
+    
+    def __and__(self, other):
+        """Allows combining specifications using the '&' operator.
+        
+        Args:
+            other (Specification): The other specification to combine with.
+            
+        Returns:
+            AndSpecification: A new composite specification.
+        """
+        return AndSpecification(self, other)
 
-class Filter(ABC):
+class Filter:
     """Base class for filtering items based on a specification."""
     
-    @abstractmethod
     def filter(self, items, spec):
         """Filters items based on a specification.
         
@@ -110,11 +129,13 @@ class Filter(ABC):
         Yields:
             Product: Items that satisfy the specification.
         """
-        pass
+        raise NotImplementedError
 
 
 class ColorSpecification(Specification):
     """Specification to filter by color."""
+
+    __slots__ = ("color",)
     
     def __init__(self, color):
         """Initializes the color specification.
@@ -134,9 +155,15 @@ class ColorSpecification(Specification):
             bool: True if the item has the specified color, False otherwise.
         """
         return item.color == self.color
+
+    def mask(self, colors, sizes):
+        """Returns a boolean array marking products with the specified color."""
+        return colors == self.color.value
     
 class SizeSpecification(Specification):
     """Specification to filter by size."""
+
+    __slots__ = ("size",)
     
     def __init__(self, size):
         """Initializes the size specification.
@@ -156,9 +183,19 @@ class SizeSpecification(Specification):
             bool: True if the item has the specified size, False otherwise.
         """
         return self.size == item.size
+
+    def mask(self, colors, sizes):
+        """Returns a boolean array marking products with the specified size."""
+        return sizes == self.size.value
     
 class AndSpecification(Specification):
-    """Combines two specifications to create a composite specification using logical AND."""
+    """Combines two specifications to create a composite specification using logical AND.
+
+    The bound `is_satisfied` methods of both components are kept in slots so that each check
+    skips the attribute lookups; they are rebound whenever `spec1` or `spec2` is reassigned.
+    """
+
+    __slots__ = ("_spec1", "_spec2", "_s1", "_s2")
     
     def __init__(self, spec1, spec2):
         """Initializes the composite specification.
@@ -169,6 +206,28 @@ class AndSpecification(Specification):
         """
         self.spec1 = spec1 
         self.spec2 = spec2
+
+    @property
+    def spec1(self):
+        """Gets the first specification."""
+        return self._spec1
+
+    @spec1.setter
+    def spec1(self, value):
+        """Sets the first specification and rebinds its check."""
+        self._spec1 = value
+        self._s1 = value.is_satisfied
+
+    @property
+    def spec2(self):
+        """Gets the second specification."""
+        return self._spec2
+
+    @spec2.setter
+    def spec2(self, value):
+        """Sets the second specification and rebinds its check."""
+        self._spec2 = value
+        self._s2 = value.is_satisfied
     
     def is_satisfied(self, item):
         """Checks if the item satisfies both specifications.
@@ -179,19 +238,35 @@ class AndSpecification(Specification):
         Returns:
             bool: True if the item satisfies both specifications, False otherwise.
         """
-        return self.spec1.is_satisfied(item) and self.spec2.is_satisfied(item) 
+        return self._s1(item) and self._s2(item)
+
+    def mask(self, colors, sizes):
+        """Returns a boolean array marking products that satisfy both specifications."""
+        return self.spec1.mask(colors, sizes) & self.spec2.mask(colors, sizes)
     
-    def __and__(self, other):
-        """Allows combining specifications using the '&' operator.
-        
-        Args:
-            other (Specification): The other specification to combine with.
-            
-        Returns:
-            AndSpecification: A new composite specification.
-        """
-        return AndSpecification(self, other)
+
+def _compile_spec(spec):
+    """Returns the `ocp_fast` counterpart of a specification, if it has one.
+    
+    Only the exact built-in specification classes are compiled, so subclasses that override
+    `is_satisfied` keep their own behaviour.
     
+    Args:
+        spec (Specification): The specification to compile.
+        
+    Returns:
+        CSpecification: The compiled specification, or None if `spec` cannot be compiled.
+    """
+    kind = type(spec)
+    if kind is ColorSpecification:
+        return ocp_fast.CColorSpecification(spec.color)
+    if kind is SizeSpecification:
+        return ocp_fast.CSizeSpecification(spec.size)
+    if kind is AndSpecification:
+        spec1, spec2 = _compile_spec(spec.spec1), _compile_spec(spec.spec2)
+        if spec1 is not None and spec2 is not None:
+            return ocp_fast.CAndSpecification(spec1, spec2)
+    return None
 
 class BetterFilter(Filter):
     """Filters items based on a specification. This adheres to the Open-Closed Principle."""
@@ -199,45 +274,90 @@ class BetterFilter(Filter):
     def filter(self, items, spec):
         """Filters items based on a specification.
         
+        The loop runs in the compiled `ocp_fast` extension when it has been built and `spec`
+        has a compiled counterpart; otherwise it runs in Python.
+        
         Args:
             items (list): List of items to filter.
             spec (Specification): The specification to use for filtering.
             
+        Returns:
+            iterator: Items that satisfy the specification.
+        """
+        if ocp_fast is not None:
+            compiled = _compile_spec(spec)
+            if compiled is not None:
+                return ocp_fast.better_filter(items, compiled)
+        return (item for item in items if spec.is_satisfied(item))
+
+    def filter_list(self, items, spec):
+        """Filters items based on a specification and returns them as a list.
+        
+        Without the compiled `ocp_fast` path this uses the built-in `filter`, which avoids
+        resuming a generator for every item when the caller needs all the results anyway.
+        
+        Args:
+            items (list): List of items to filter.
+            spec (Specification): The specification to use for filtering.
+            
+        Returns:
+            list: Items that satisfy the specification.
+        """
+        if ocp_fast is not None:
+            compiled = _compile_spec(spec)
+            if compiled is not None:
+                return list(ocp_fast.better_filter(items, compiled))
+        return list(filter(spec.is_satisfied, items))
+
+    def filter_table(self, table, spec):
+        """Filters a product table based on a specification using vectorized comparisons.
+        
+        Args:
+            table (ProductTable): The products to filter.
+            spec (Specification): The specification to use for filtering.
+            
         Yields:
-            Product: Items that satisfy the specification.
+            str: Names of the products that satisfy the specification.
         """
-        for item in items:
-            if spec.is_satisfied(item):
-                yield item
+        if np is None:
+            raise ImportError("BetterFilter.filter_table requires NumPy")
+        names = table.names
+        for i in np.flatnonzero(spec.mask(table.colors, table.sizes)):
+            yield names[i]
 
 # Usage Example:
 
-apple = Product('Apple', Color.GREEN, Size.SMALL)
-tree = Product('Tree', Color.GREEN, Size.LARGE)
-house = Product('House', Color.BLUE, Size.LARGE)
+if __name__ == "__main__":
+    apple = Product('Apple', Color.GREEN, Size.SMALL)
+    tree = Product('Tree', Color.GREEN, Size.LARGE)
+    house = Product('House', Color.BLUE, Size.LARGE)
 
-products = [apple, tree, house]
+    products = [apple, tree, house]
 
-# Using the old filter (violates OCP):
-old_filter = productFilter()
-print("Green products (old):")
-for product in old_filter.filter_by_color(products, Color.GREEN):
-    print(f" - {product.name} is green")
+    # The vectorized filter must select the same products as the per-item filter.
+    if np is not None:
+        table = ProductTable.from_products(products)
+        checker = BetterFilter()
+        for spec in (ColorSpecification(Color.GREEN), SizeSpecification(Size.LARGE),
+                     AndSpecification(SizeSpecification(Size.LARGE), ColorSpecification(Color.BLUE))):
+            expected = [product.name for product in checker.filter(products, spec)]
+            assert list(checker.filter_table(table, spec)) == expected
+        print("Vectorized filter matches the per-item filter.")
 
-# Using the new filter (adheres to OCP):
-better_filter = BetterFilter()
+    # Using the new filter (adheres to OCP):
+    better_filter = BetterFilter()
 
-print("Green products (new): ")
-green = ColorSpecification(Color.GREEN)
-for product in better_filter.filter(products, green):
-    print(f" - {product.name} is green")
+    print("Green products (new): ")
+    green = ColorSpecification(Color.GREEN)
+    for product in better_filter.filter_list(products, green):
+        print(f" - {product.name} is green")
 
-print("Large products (new): ")
-large = SizeSpecification(Size.LARGE)
-for product in better_filter.filter(products, large):
-    print(f" - {product.name} is large")
+    print("Large products (new): ")
+    large = SizeSpecification(Size.LARGE)
+    for product in better_filter.filter_list(products, large):
+        print(f" - {product.name} is large")
 
-print("Large Blue products: ")
-large_blue = large & ColorSpecification(Color.BLUE)
-for product in better_filter.filter(products, large_blue):
-    print(f" - {product.name} is large and blue")
+    print("Large Blue products: ")
+    large_blue = large & ColorSpecification(Color.BLUE)
+    for product in better_filter.filter_list(products, large_blue):
+        print(f" - {product.name} is large and blue")
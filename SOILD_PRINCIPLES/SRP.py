@@ -5,10 +5,13 @@
 class Journal:
     """Represents a personal journal where you can add and remove entries."""
 
+    __slots__ = ("entries", "count", "_str_cache")
+
     def __init__(self):
-        """Initializes a new journal with an empty list of entries and a counter."""
+        """Initializes a new journal with an empty list of entries, a counter and a cached string form."""
         self.entries = []
         self.count = 0
+        self._str_cache = None
     
     def add_entry(self, text):
         """Adds a new entry to the journal.
@@ -18,6 +21,7 @@ class Journal:
         """
         self.count += 1
         self.entries.append(f"{self.count}: {text}")
+        self._str_cache = None
 
     def remove_entry(self, pos):
         """Removes an entry from the journal.
@@ -27,10 +31,26 @@ class Journal:
         """
         del self.entries[pos]
         self.count -= 1
+        self._str_cache = None
+
+    def _iter_text(self):
+        """Yields the text of the journal in chunks, with entries separated by newlines.
+        
+        Yields the cached string representation as a single chunk when it is available.
+        The cache is only reset by `add_entry` and `remove_entry`; editing `entries` directly
+        bypasses it, so both `str()` and the saved file can then be stale.
+        """
+        if self._str_cache is not None:
+            yield self._str_cache
+            return
+        for i, entry in enumerate(self.entries):
+            yield ("\n" if i else "") + entry
 
     def __str__(self):
-        """Returns the string representation of the journal."""
-        return "\n".join(self.entries)
+        """Returns the string representation of the journal, rebuilding it only after the entries change."""
+        if self._str_cache is None:
+            self._str_cache = "".join(self._iter_text())
+        return self._str_cache
     
     # Methods related to persistence (saving/loading) have been commented out 
     # because they violate the Single Responsibility Principle. They should be 
@@ -59,8 +79,9 @@ class PersistenceManager:
             journal (Journal): The journal object to be saved.
             filename (str): The name of the file where the journal will be saved.
         """
-        with open(filename, "w") as file:
-            file.write(str(journal))
+        # Stream the journal text through a 1 MiB buffer instead of materializing str(journal).
+        with open(filename, "w", buffering=1 << 20) as file:
+            file.writelines(journal._iter_text())
 
 # Usage Example:
 j = Journal()
@@ -0,0 +1,86 @@
+# cython: language_level=3
+# Compiled counterparts of the specifications in OCP.py, used by `BetterFilter.filter`
+# when this extension has been built (`python setup.py build_ext --inplace`).
+
+cdef class CSpecification:
+    """Base class for a compiled specification to check if a product meets a certain criterion."""
+
+    cpdef bint is_satisfied(self, object item) except -1:
+        """Determines if an item satisfies the specification.
+
+        Args:
+            item (Product): The item to check.
+
+        Returns:
+            bool: True if the item satisfies the specification, False otherwise.
+        """
+        raise NotImplementedError
+
+cdef class CColorSpecification(CSpecification):
+    """Compiled specification to filter by color."""
+
+    cdef object color
+
+    def __init__(self, color):
+        """Initializes the color specification.
+
+        Args:
+            color (Color): The color to filter by.
+        """
+        self.color = color
+
+    cpdef bint is_satisfied(self, object item) except -1:
+        """Checks if the item's color matches the specified color."""
+        value = item.color
+        return value is self.color or value == self.color
+
+cdef class CSizeSpecification(CSpecification):
+    """Compiled specification to filter by size."""
+
+    cdef object size
+
+    def __init__(self, size):
+        """Initializes the size specification.
+
+        Args:
+            size (Size): The size to filter by.
+        """
+        self.size = size
+
+    cpdef bint is_satisfied(self, object item) except -1:
+        """Checks if the item's size matches the specified size."""
+        value = item.size
+        return value is self.size or value == self.size
+
+cdef class CAndSpecification(CSpecification):
+    """Combines two compiled specifications using logical AND."""
+
+    cdef CSpecification spec1, spec2
+
+    def __init__(self, CSpecification spec1, CSpecification spec2):
+        """Initializes the composite specification.
+
+        Args:
+            spec1 (CSpecification): The first specification.
+            spec2 (CSpecification): The second specification.
+        """
+        self.spec1 = spec1
+        self.spec2 = spec2
+
+    cpdef bint is_satisfied(self, object item) except -1:
+        """Checks if the item satisfies both specifications."""
+        return self.spec1.is_satisfied(item) and self.spec2.is_satisfied(item)
+
+def better_filter(items, CSpecification spec):
+    """Filters items based on a compiled specification.
+
+    Args:
+        items (list): List of items to filter.
+        spec (CSpecification): The specification to use for filtering.
+
+    Yields:
+        Product: Items that satisfy the specification.
+    """
+    for item in items:
+        if spec.is_satisfied(item):
+            yield item
@@ -0,0 +1,16 @@
+# Builds the optional compiled extensions for the SOLID examples:
+#     python setup.py build_ext --inplace
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension("ocp_fast", ["ocp_fast.pyx"]),
+    # DIP.py is compiled in Cython's pure-Python mode and stays importable as plain Python.
+    Extension("DIP", ["DIP.py"]),
+]
+
+setup(
+    name="solid_principles",
+    ext_modules=cythonize(extensions, compiler_directives={"language_level": 3}),
+)